@@ -128,7 +128,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -136,7 +136,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -144,8 +145,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -161,7 +162,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -178,7 +178,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -199,11 +199,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     % if sch=='unthreaded':
@@ -247,13 +244,13 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
+        return np.asarray(translation_masks)
 
     % endfor
 
@@ -276,7 +273,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -284,7 +281,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -292,8 +290,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -309,7 +307,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -326,7 +323,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -344,11 +341,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     for j in prange(nRows):
@@ -386,10 +380,10 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
\ No newline at end of file
+        return np.asarray(translation_masks)
\ No newline at end of file
@@ -122,7 +122,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -130,7 +130,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -138,8 +139,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -155,7 +156,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -172,7 +172,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -193,11 +193,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     for j in range(nRows):
@@ -235,13 +232,13 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
+        return np.asarray(translation_masks)
 
     def _run_threaded(self, float[:,:, :] img_stack, int ref_index, int max_shift, int blocks_per_axis, float min_similarity):
         """
@@ -261,7 +258,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -269,7 +266,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -277,8 +275,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -294,7 +292,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -311,7 +308,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -332,11 +329,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     for j in prange(nRows):
@@ -374,13 +368,13 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
+        return np.asarray(translation_masks)
 
     def _run_threaded_guided(self, float[:,:, :] img_stack, int ref_index, int max_shift, int blocks_per_axis, float min_similarity):
         """
@@ -400,7 +394,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -408,7 +402,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -416,8 +411,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -433,7 +428,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -450,7 +444,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -471,11 +465,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     for j in prange(nRows, schedule="guided"):
@@ -513,13 +504,13 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
+        return np.asarray(translation_masks)
 
     def _run_threaded_dynamic(self, float[:,:, :] img_stack, int ref_index, int max_shift, int blocks_per_axis, float min_similarity):
         """
@@ -539,7 +530,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -547,7 +538,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -555,8 +547,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -572,7 +564,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -589,7 +580,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -610,11 +601,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     for j in prange(nRows, schedule="dynamic"):
@@ -652,13 +640,13 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
+        return np.asarray(translation_masks)
 
     def _run_threaded_static(self, float[:,:, :] img_stack, int ref_index, int max_shift, int blocks_per_axis, float min_similarity):
         """
@@ -678,7 +666,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -686,7 +674,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -694,8 +683,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -711,7 +700,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -728,7 +716,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -749,11 +737,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     for j in prange(nRows, schedule="static"):
@@ -791,13 +776,13 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
+        return np.asarray(translation_masks)
 
 
     def _run_opencl(self, float[:,:,:] img_stack, int ref_index, int max_shift, int blocks_per_axis, float min_similarity, device=None):
@@ -819,7 +804,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef int block_nRows = nRows // blocks_per_axis
         cdef int block_nCols = nCols // blocks_per_axis
 
-        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2)).astype(np.float32)
+        cdef float[:,:,:] translation_masks = np.zeros((nChannels, nRows, nCols * 2), dtype=np.float32)
     
         cdef int channel, row_i, col_i
         cdef int row_start, col_start
@@ -827,7 +812,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float[:,:] img_slice 
         cdef float[:,:] slice_crop, ref_crop, slice_ccm
 
-        cdef float[:,:] flow_arrows
+        # scratch buffer reused by every channel, only the first n_flow_arrows rows are read
+        cdef float[:,:] flow_arrows = np.zeros((blocks_per_axis**2,4), dtype=np.float32)
         cdef int n_flow_arrows = 0
 
         cdef float[:] max_coords
@@ -835,8 +821,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
         cdef float vector_c, vector_r, ccm_max_value
 
         cdef int ccm_cols, ccm_rows
-        translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-        translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
+        translation_matrix_c = np.zeros((nRows, nCols), dtype=np.float32)
+        translation_matrix_r = np.zeros((nRows, nCols), dtype=np.float32)
         cdef float[:,:] _translation_matrix_c = translation_matrix_c
         cdef float[:,:] _translation_matrix_r = translation_matrix_r
 
@@ -852,7 +838,6 @@ class ChannelRegistrationEstimator(LiquidEngine):
             else:
                 img_slice = img_stack[channel,:,:]
                 n_flow_arrows = 0
-                flow_arrows = np.zeros((blocks_per_axis**2,4)).astype(np.float32)
                 for row_i in range(blocks_per_axis):
                     for col_i in range(blocks_per_axis):
                         row_start = row_i * block_nRows
@@ -869,7 +854,7 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                         # Upscale 10x around max_idx                     
                         upscaled_ccm_slice = crsm.run(np.ascontiguousarray(slice_ccm),0,0,10,10,run_type=_runtype)[0]                    
-                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.array(upscaled_ccm_slice).shape)
+                        max_idx_upscaled = np.unravel_index(np.argmax(upscaled_ccm_slice), np.asarray(upscaled_ccm_slice).shape)
                         max_coords = np.asarray(max_idx_upscaled).astype(np.float32) // 10
                         ccm_max_value = upscaled_ccm_slice[max_idx_upscaled[0],max_idx_upscaled[1]]
 
@@ -887,11 +872,8 @@ class ChannelRegistrationEstimator(LiquidEngine):
                 if n_flow_arrows==0:
                     return None
 
-                translation_matrix_r = np.zeros((nRows, nCols)).astype(np.float32)
-                translation_matrix_c = np.zeros((nRows, nCols)).astype(np.float32)
-
                 max_distance = sqrt(nRows * nRows + nCols * nCols)
-                distances = np.zeros((n_flow_arrows,nRows,nCols)).astype(np.float32)
+                distances = np.zeros((n_flow_arrows,nRows,nCols), dtype=np.float32)
 
                 with nogil:
                     for j in prange(nRows):
@@ -929,10 +911,10 @@ class ChannelRegistrationEstimator(LiquidEngine):
 
                 if blocks_per_axis > 1:
 
-                    _translation_matrix_c = _gaussian_filter(np.array(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
-                    _translation_matrix_r = _gaussian_filter(np.array(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_c = _gaussian_filter(np.asarray(_translation_matrix_c), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
+                    _translation_matrix_r = _gaussian_filter(np.asarray(_translation_matrix_r), _runtype, sigma=max(block_nCols, block_nRows) / 2.0)
 
                 translation_masks[channel,:,:nCols] = _translation_matrix_c
                 translation_masks[channel,:, nCols:] = _translation_matrix_r
 
-        return np.array(translation_masks)
\ No newline at end of file
+        return np.asarray(translation_masks)
\ No newline at end of file
@@ -85,7 +85,15 @@ cdef float[:, :, :] _calculate_ccm_from_ref(float[:, :, :] img_stack, float[:, :
 
 
 cdef float[:, :] _calculate_slice_ccm(float[:, :] img_ref, float[:, :] img_slice):
-    cdef float[:, :] ccm_slice = sp.fft.fftshift(sp.fft.ifft2(sp.fft.fft2(img_ref) * sp.fft.fft2(img_slice).conj())).real.astype(np.float32)
+    # both images are real, so the half spectrum from rfft2 is enough and irfft2 already returns a real array
+    # workers=-1 lets pocketfft split the transforms over all available cores
+    cdef tuple shape = (img_ref.shape[0], img_ref.shape[1])
+    # float32 inputs give complex64 spectra, the cross power spectrum is built in place in ft_slice
+    ft_ref = sp.fft.rfft2(img_ref, workers=-1)
+    ft_slice = sp.fft.rfft2(img_slice, workers=-1)
+    np.conjugate(ft_slice, out=ft_slice)
+    ft_slice *= ft_ref
+    cdef float[:, :] ccm_slice = sp.fft.fftshift(sp.fft.irfft2(ft_slice, s=shape, workers=-1)).astype(np.float32, copy=False)
     ccm_slice = ccm_slice[::-1, ::-1]
     _normalize_ccm(img_ref, img_slice, ccm_slice)
 
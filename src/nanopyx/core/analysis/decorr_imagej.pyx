@@ -8,7 +8,6 @@ from math import cos, fabs, sqrt
 
 import io
 import numpy as np
-from matplotlib import pyplot as plt
 from scipy.ndimage import gaussian_filter
 
 from ..utils.timeit import timeit2
@@ -443,6 +442,8 @@ cdef class DecorrAnalysis:
         """
         Returns the plot of the results of the analysis as a numpy array
         """
+        from matplotlib import pyplot as plt
+
         fig, ax = plt.subplots(dpi=150)
         x = np.linspace(0.0, 1.0, self.n_r)
         for k in range(self.d0.shape[0]):
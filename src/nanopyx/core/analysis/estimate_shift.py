@@ -15,7 +15,8 @@ class GetMaxOptimizer(object):
         :param slice_ccm: numpy array with shape (y, x); ccm from which to extract the maximum value with subpixel
         precision.
         """
-        self.slice_ccm = slice_ccm
+        # converted once so that each minimizer step does not copy the whole ccm
+        self.slice_ccm = np.ascontiguousarray(slice_ccm, dtype=np.float32)
 
     def get_interpolated_px_value(self, coords):
         """
@@ -2,7 +2,6 @@
 
 import io
 import numpy as np
-from matplotlib import pyplot as plt
 from scipy.signal import savgol_filter
 from scipy.signal.windows import tukey
 from ..transform.padding import pad_w_zeros_2d
@@ -278,6 +277,8 @@ cdef class FIRECalculator:
         """
         Returns the plot of the results of the analysis as a numpy array
         """
+        from matplotlib import pyplot as plt
+
         fig, ax= plt.subplots(dpi=150)
         ax.plot(np.array(self.frc_curve[:, 0]), np.array(self.frc_curve[:, 1]))
         ax.axhline(y=1.0/7.0, color='r', linestyle='-')
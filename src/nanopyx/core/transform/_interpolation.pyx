@@ -17,7 +17,7 @@ cdef float _cr_interpolate(float[:, :] img_stack, float row, float col):
     return _c_cr_interpolate(&img_stack[0,0], row, col, rows, cols)
 
 def cr_interpolate(img_stack, row, col):
-    img_stack = np.array(img_stack, dtype=np.float32)
+    img_stack = np.ascontiguousarray(img_stack, dtype=np.float32)
     return _cr_interpolate(img_stack, row, col)
 
 def interpolate_3d(image, magnification_xy: int = 5, magnification_z: int = 5):
@@ -5,7 +5,6 @@ import numpy as np
 cimport numpy as np
 
 from skimage.restoration import denoise_nl_means
-from matplotlib import pyplot as plt
 
 from libc.math cimport exp, isnan, fmax
 from cython.parallel import parallel, prange
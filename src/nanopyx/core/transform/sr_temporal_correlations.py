@@ -1,7 +1,14 @@
 import numpy as np
 
+from ...__njit__ import njit, prange, njit_works
 
-def calculate_SRRF_temporal_correlations(im: np.array, order: int = 1, do_integrate_lag_times: bool = 0):
+# bytes of float32 centred data reduced at once by the numpy ACRF path, keeps each strip cache resident
+ACRF_TILE_BYTES = 2 * 1024 * 1024
+
+
+def calculate_SRRF_temporal_correlations(
+    im: np.array, order: int = 1, do_integrate_lag_times: bool = 0, engine: str = "numpy"
+):
     """
     Calculate temporal correlations for Super-Resolution Radial Fluctuations (SRRF).
 
@@ -11,12 +18,15 @@ def calculate_SRRF_temporal_correlations(im: np.array, order: int = 1, do_integr
             Defaults to 1.
         do_integrate_lag_times (bool, optional): Whether to integrate lag times.
             Defaults to False (0).
+        engine (str, optional): Backend used for orders -1, 2, 3 and 4, either "numpy" or "numba".
+            Falls back to "numpy" if Numba is not installed. Defaults to "numpy".
 
     Returns:
         np.array: Calculated temporal correlations based on the specified order and integration.
 
     Raises:
         AssertionError: If the input array doesn't have 3 dimensions or if the order is greater than 4.
+        ValueError: If `engine` is not "numpy" or "numba".
 
     Note:
         - If `order` is 0, the maximum value over time is calculated.
@@ -25,6 +35,9 @@ def calculate_SRRF_temporal_correlations(im: np.array, order: int = 1, do_integr
         - If `order` is 2, 3, or 4, more advanced calculations are performed based on `do_integrate_lag_times`.
 
     """
+    if engine not in ("numpy", "numba"):
+        raise ValueError(f"Engine must be numpy or numba, got {engine}")
+
     im = np.array(im, dtype="float32")
     assert im.ndim == 3 and order <= 4
 
@@ -35,10 +48,10 @@ def calculate_SRRF_temporal_correlations(im: np.array, order: int = 1, do_integr
         out_array = np.mean(im, axis=0)
 
     elif order == -1:
-        out_array = calculate_pairwise_product_sum(im)
+        out_array = calculate_pairwise_product_sum(im, engine=engine)
 
     else:  # order = 2 or order = 3 or order = 4
-        out_array = calculate_acrf_(im, order, do_integrate_lag_times)
+        out_array = calculate_acrf_(im, order, do_integrate_lag_times, engine=engine)
 
     return out_array
 
@@ -75,40 +88,41 @@ def calculate_eSRRF_temporal_correlations(im: np.array, correlation: str):
     return out_array
 
 
-def calculate_pairwise_product_sum(rad_array):
+def calculate_pairwise_product_sum(rad_array, engine: str = "numpy"):
     """
     Calculate pairwise product sum of a 3D numpy array.
 
     Args:
         rad_array (np.array): Input 3D numpy array.
+        engine (str, optional): Either "numpy" or "numba". Defaults to "numpy".
 
     Returns:
         np.array: Pairwise product sum of the input array.
 
+    Raises:
+        ValueError: If `engine` is not "numpy" or "numba".
+
     """
-    n_time_points, height_m, width_m = rad_array.shape
+    n_time_points = rad_array.shape[0]
 
-    out_array = np.zeros((height_m, width_m), dtype=np.float32)
-    # max_array = np.max(rad_array, axis=0)
-    counter = 0
-    pps = 0
-
-    for t0 in range(n_time_points):
-        r0 = np.maximum(rad_array[t0], 0)
-        if np.any(r0) > 0:
-            for t1 in range(t0, n_time_points):
-                r1 = np.maximum(rad_array[t1], 0)
-                pps += r0 * r1
-                counter += 1
-        else:
-            counter += n_time_points - t0
-    pps = pps / max(counter, 1)
-    out_array = pps
+    if _use_numba(engine):
+        pps = _njit_pairwise_product_sum(np.ascontiguousarray(rad_array, dtype=np.float32))
+    else:
+        # sum over all pairs t0 <= t1 of r[t0] * r[t1] equals ((sum r)^2 + sum r^2) / 2,
+        # which avoids looping over the O(T^2) frame pairs
+        r = np.clip(rad_array, 0, None).astype(np.float32, copy=False)
+        sum_r = r.sum(axis=0)
+        sum_sq = np.einsum("thw,thw->hw", r, r)
+        pps = 0.5 * (sum_r * sum_r + sum_sq)
+
+    # every t0 accounts for (n_time_points - t0) pairs, whether or not its frame is empty
+    counter = n_time_points * (n_time_points + 1) // 2
+    out_array = pps / max(counter, 1)
 
     return out_array
 
 
-def calculate_acrf_(rad_array, order, do_integrate_lag_times):
+def calculate_acrf_(rad_array, order, do_integrate_lag_times, engine: str = "numpy"):
     """
     Calculate Auto-Correlation Radial Fluctuations (ACRF) for temporal data.
 
@@ -116,92 +130,176 @@ def calculate_acrf_(rad_array, order, do_integrate_lag_times):
         rad_array (np.array): Input 3D numpy array containing temporal data.
         order (int): Order of ACRF calculation.
         do_integrate_lag_times (bool): Whether to integrate lag times.
+        engine (str, optional): Either "numpy" or "numba". Defaults to "numpy".
 
     Returns:
         np.array: Calculated ACRF based on the specified order and integration.
 
+    Raises:
+        ValueError: If `engine` is not "numpy" or "numba".
+
     """
-    im = rad_array.copy()
+    # rad_array is only read, binning below builds new arrays instead of writing into it
+    im = rad_array
     n_time_points, height_m, width_m = im.shape
     mean = np.mean(im, axis=0)
 
-    out_array = np.zeros((height_m, width_m), dtype=np.float32)
-
-    abcd = np.zeros((height_m, width_m), dtype=np.float32)
-    abc = np.zeros((height_m, width_m), dtype=np.float32)
-    ab = np.zeros((height_m, width_m), dtype=np.float32)
-    cd = np.zeros((height_m, width_m), dtype=np.float32)
-    ac = np.zeros((height_m, width_m), dtype=np.float32)
-    bd = np.zeros((height_m, width_m), dtype=np.float32)
-    ad = np.zeros((height_m, width_m), dtype=np.float32)
-    bc = np.zeros((height_m, width_m), dtype=np.float32)
+    if _use_numba(engine):
+        cumulant = _njit_acrf_cumulant
+        im = np.ascontiguousarray(im, dtype=np.float32)
+        mean = mean.astype(np.float32, copy=False)
+    else:
+        cumulant = _calculate_acrf_cumulant
 
     if do_integrate_lag_times != 1:
-        t = 0
-        while t < n_time_points - order:
-            ab = ab + (im[t] - mean) * (im[t + 1] - mean)
-            if order == 3:
-                abc = abc + (im[t] - mean) * (im[t + 1] - mean) + (im[t + 2] - mean)
-            if order == 4:
-                a = im[t] - mean
-                b = im[t + 1] - mean
-                c = im[t + 2] - mean
-                d = im[t + 3] - mean
-                abcd = abcd + np.multiply(np.multiply(np.multiply(a, b), c), d)
-                cd = cd + np.multiply(c, d)
-                ac = ac + np.multiply(a, c)
-                bd = bd + np.multiply(b, d)
-                ad = ad + np.multiply(a, d)
-                bc = bc + np.multiply(b, c)
-            t = t + 1
-        if order == 3:
-            out_array = np.absolute(abc) / n_time_points
-        elif order == 4:
-            out_array = np.absolute(abcd - ab * cd - ac * bd - ad * bc) / n_time_points
-        else:
-            out_array = np.absolute(ab) / n_time_points
+        out_array = cumulant(im, mean, order) / n_time_points
 
     else:
+        out_array = np.zeros((height_m, width_m), dtype=np.float32)
         n_binned_time_points = n_time_points
-        tbin = 0
         while n_binned_time_points > order:
-            t = 0
-            ab = np.zeros((height_m, width_m), dtype=np.float32)
-            while t < n_binned_time_points - order:
-                tbin = t * order
-                ab = ab + (im[t] - mean) * (im[t + 1] - mean)
+            out_array = cumulant(im, mean, order) / n_binned_time_points
+
+            # bin consecutive groups of `order` frames for the next lag time
+            n_binned_time_points = n_binned_time_points // order
+            im = im[: n_binned_time_points * order].reshape(n_binned_time_points, order, height_m, width_m)
+            im = im.mean(axis=1)
+
+    return out_array
+
+
+def _use_numba(engine: str) -> bool:
+    if engine not in ("numpy", "numba"):
+        raise ValueError(f"Engine must be numpy or numba, got {engine}")
+    return engine == "numba" and njit_works()
+
+
+def _calculate_acrf_cumulant(im, mean, order):
+    """
+    Calculate the absolute value of the temporal cumulant of the given order, summed over time.
+
+    The image plane is processed in strips of rows so that all products of a strip are computed
+    while its time traces are still in cache.
+
+    Args:
+        im (np.array): Input 3D numpy array containing temporal data.
+        mean (np.array): Temporal mean used to center the input array.
+        order (int): Order of the cumulant, should be 2, 3 or 4.
+
+    Returns:
+        np.array: Absolute cumulant summed over the first (n_time_points - order) time points.
+
+    """
+    n_time_points, height_m, width_m = im.shape
+    out_array = np.empty((height_m, width_m), dtype=np.float32)
+
+    tile_rows = max(1, ACRF_TILE_BYTES // (4 * max(n_time_points * width_m, 1)))
+    for row in range(0, height_m, tile_rows):
+        out_array[row : row + tile_rows] = _calculate_acrf_cumulant_tile(
+            im[:, row : row + tile_rows], mean[row : row + tile_rows], order
+        )
+
+    return out_array
+
+
+def _calculate_acrf_cumulant_tile(im, mean, order):
+    """
+    Calculate the absolute cumulant of _calculate_acrf_cumulant for a single strip of rows.
+    """
+    c = np.subtract(im, mean, dtype=np.float32)
+    n_terms = max(c.shape[0] - order, 0)
+
+    a = c[:n_terms]
+    b = c[1 : n_terms + 1]
+
+    if order == 3:
+        c_ = c[2 : n_terms + 2]
+        abc = np.einsum("thw,thw,thw->hw", a, b, c_)
+        return np.absolute(abc)
+
+    elif order == 4:
+        c_ = c[2 : n_terms + 2]
+        d = c[3 : n_terms + 3]
+        abcd = np.einsum("thw,thw,thw,thw->hw", a, b, c_, d)
+        ab = np.einsum("thw,thw->hw", a, b)
+        cd = np.einsum("thw,thw->hw", c_, d)
+        ac = np.einsum("thw,thw->hw", a, c_)
+        bd = np.einsum("thw,thw->hw", b, d)
+        ad = np.einsum("thw,thw->hw", a, d)
+        bc = np.einsum("thw,thw->hw", b, c_)
+        return np.absolute(abcd - ab * cd - ac * bd - ad * bc)
+
+    else:
+        ab = np.einsum("thw,thw->hw", a, b)
+        return np.absolute(ab)
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _njit_acrf_cumulant(im, mean, order):
+    """
+    Numba version of _calculate_acrf_cumulant, accumulates every product for a pixel in a single pass over time.
+    """
+    n_time_points, height_m, width_m = im.shape
+    out_array = np.zeros((height_m, width_m), dtype=np.float32)
+
+    for h in prange(height_m):
+        for w in range(width_m):
+            m = mean[h, w]
+            abcd = 0.0
+            abc = 0.0
+            ab = 0.0
+            cd = 0.0
+            ac = 0.0
+            bd = 0.0
+            ad = 0.0
+            bc = 0.0
+            for t in range(n_time_points - order):
+                a = im[t, h, w] - m
+                b = im[t + 1, h, w] - m
+                ab += a * b
                 if order == 3:
-                    abc = abc + (im[t] - mean) * (im[t + 1] - mean) + (im[t + 2] - mean)
-                if order == 4:
-                    a = im[t] - mean
-                    b = im[t + 1] - mean
-                    c = im[t + 2] - mean
-                    d = im[t + 3] - mean
-                    abcd = abcd + np.multiply(np.multiply(np.multiply(a, b), c), d)
-                    cd = cd + np.multiply(c, d)
-                    ac = ac + np.multiply(a, c)
-                    bd = bd + np.multiply(b, d)
-                    ad = ad + np.multiply(a, d)
-                    bc = bc + np.multiply(b, c)
-
-                im[t] = np.zeros((height_m, width_m), dtype=np.float32)
-
-                if tbin < n_binned_time_points:
-                    for _t in range(order - 1):
-                        im[t] = im[t] + np.divide(im[tbin + _t], order)
-                t = t + 1
+                    c = im[t + 2, h, w] - m
+                    abc += a * b * c
+                elif order == 4:
+                    c = im[t + 2, h, w] - m
+                    d = im[t + 3, h, w] - m
+                    abcd += a * b * c * d
+                    cd += c * d
+                    ac += a * c
+                    bd += b * d
+                    ad += a * d
+                    bc += b * c
             if order == 3:
-                out_array = np.absolute(abc) / n_binned_time_points
+                out_array[h, w] = abs(abc)
             elif order == 4:
-                out_array = np.absolute(abcd - ab * cd - ac * bd - ad * bc) / n_binned_time_points
+                out_array[h, w] = abs(abcd - ab * cd - ac * bd - ad * bc)
             else:
-                out_array = np.absolute(ab) / n_binned_time_points
-
-            n_binned_time_points = n_binned_time_points / order
+                out_array[h, w] = abs(ab)
 
     return out_array
 
 
+@njit(cache=True, parallel=True, fastmath=True)
+def _njit_pairwise_product_sum(rad_array):
+    """
+    Numba version of the pairwise product sum, returns the sum over all pairs t0 <= t1 of r[t0] * r[t1].
+    """
+    n_time_points, height_m, width_m = rad_array.shape
+    pps = np.zeros((height_m, width_m), dtype=np.float32)
+
+    for h in prange(height_m):
+        for w in range(width_m):
+            sum_r = 0.0
+            sum_sq = 0.0
+            for t in range(n_time_points):
+                r = max(rad_array[t, h, w], 0.0)
+                sum_r += r
+                sum_sq += r * r
+            pps[h, w] = 0.5 * (sum_r * sum_r + sum_sq)
+
+    return pps
+
+
 def calculate_tac2(rad_array):
     """
     Calculate Temporal Autocorrelation 2 (TAC2) for temporal data.
@@ -216,7 +314,9 @@ def calculate_tac2(rad_array):
     mean = np.mean(rad_array, axis=0)
     centered = rad_array - mean  # center data around the mean
     nlag = 1  # number of lags to compute TAC2 for
-    out_array = np.mean(centered[:-nlag] * centered[nlag:], axis=0)
+    n_products = centered.shape[0] - nlag
+    # fused multiply-reduce, avoids allocating the (T - nlag, H, W) product array
+    out_array = np.einsum("thw,thw->hw", centered[:-nlag], centered[nlag:]) / n_products
 
     return out_array
 
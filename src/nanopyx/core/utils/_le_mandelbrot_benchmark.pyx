@@ -15,6 +15,9 @@ from ._le_mandelbrot_benchmark_ import njit_mandelbrot as _njit_mandelbrot
 cdef extern from "_c_mandelbrot_benchmark.h":
     int _c_mandelbrot(float row, float col) nogil
 
+# OpenCL context, queue and compiled program for each (device, double precision) pair
+_cl_programs = {}
+
 class MandelbrotBenchmark(LiquidEngine):
     """
     Mandelbrot Benchmark using the NanoPyx Liquid Engine
@@ -48,18 +51,19 @@ class MandelbrotBenchmark(LiquidEngine):
         if device is None:
             device = _fastest_device
 
-        # QUEUE AND CONTEXT
-        cl_ctx = cl.Context([device['device']])
-        cl_queue = cl.CommandQueue(cl_ctx)
-
-        code = self._get_cl_code("_le_mandelbrot_benchmark_.cl", device['DP'])
+        # QUEUE, CONTEXT AND PROGRAM, built once per device and reused across runs
+        key = (device['device'], device['DP'])
+        if key not in _cl_programs:
+            cl_ctx = cl.Context([device['device']])
+            cl_queue = cl.CommandQueue(cl_ctx)
+            code = self._get_cl_code("_le_mandelbrot_benchmark_.cl", device['DP'])
+            prg = cl.Program(cl_ctx, code).build()
+            _cl_programs[key] = (cl_ctx, cl_queue, prg)
+        cl_ctx, cl_queue, prg = _cl_programs[key]
 
         # Create array for mandelbrot set
         im_mandelbrot = cl_array.zeros(cl_queue, (size, size), dtype=np.int32)
 
-        # Create the program
-        prg = cl.Program(cl_ctx, code).build()
-
         # Run the kernel
         prg.mandelbrot(
             cl_queue,
@@ -101,7 +101,7 @@ class ChannelRegistrationCorrector(object):
 
         for channel in channels_list:
             img_slice = img_stack[channel].astype(np.float32)
-            translation_mask = translation_masks[channel].astype(np.float32)
+            translation_mask = np.asarray(translation_masks[channel], dtype=np.float32)
             if np.sum(translation_mask) == 0:
                 self.aligned_stack[channel] = img_slice
             else:
@@ -1,6 +1,6 @@
 import numpy as np
 from numpy import array
-from skimage.io import imsave
+from tifffile import imwrite
 
 from .corrector import ChannelRegistrationCorrector
 from ...core.analysis._le_channel_registration import ChannelRegistrationEstimator as leChannelRegistrationEstimator
@@ -79,7 +79,7 @@ class ChannelRegistrationEstimator(object):
         if path is None:
             path = input("Please provide a filepath to save the translation masks") + "_translation_masks.tif"
 
-        imsave(path + "_translation_masks.tif", self.translation_masks)
+        imwrite(path + "_translation_masks.tif", self.translation_masks)
 
     def estimate(
         self,
@@ -122,8 +122,9 @@ class ChannelRegistrationEstimator(object):
             If `apply` is True, it applies elastic transformation to the image stack and returns the aligned stack.
         """
 
-        if ref_channel > img_stack.shape[0]:
-            print("Reference channel number cannot be bigger than number of channels!")
+        # channels live on axis 0, valid reference indices are 0 to n_channels - 1
+        if ref_channel < 0 or ref_channel >= img_stack.shape[0]:
+            print("Reference channel number must be between 0 and the number of channels minus one!")
             return None
 
         estimator = leChannelRegistrationEstimator()
@@ -1,5 +1,4 @@
 import numpy as np
-from matplotlib import pyplot as plt
 from ...core.analysis.parameter_sweep import ParameterSweep
 
 
@@ -60,6 +59,8 @@ def run_esrrf_parameter_sweep(
     )
 
     if plot_sweep:
+        from matplotlib import pyplot as plt
+
         fig, ax = plt.subplots()
         ax.imshow(out, cmap="plasma")
         ax.set_xticks(np.arange(len(radii)), labels=radii)
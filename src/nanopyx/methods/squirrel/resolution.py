@@ -1,5 +1,4 @@
 import numpy as np
-from matplotlib import pyplot as plt
 from ...core.analysis.decorr import DecorrAnalysis
 from ...core.analysis.frc import FIRECalculator
 
@@ -36,6 +35,8 @@ def calculate_frc(
     res = frc_calc.calculate_fire_number(frame_1, frame_2)
 
     if plot_frc_curve:
+        from matplotlib import pyplot as plt
+
         plt.axis("off")
         plt.subplots_adjust(left=0, right=1, top=1, bottom=0, wspace=0, hspace=0)
         plt.imshow(frc_calc.plot_frc_curve())
@@ -92,6 +93,8 @@ def calculate_decorr_analysis(
     decorr_calc.run_analysis(frame)
 
     if plot_decorr_analysis:
+        from matplotlib import pyplot as plt
+
         plt.axis("off")
         plt.subplots_adjust(left=0, right=1, top=1, bottom=0, wspace=0, hspace=0)
         plt.imshow(decorr_calc.plot_results())
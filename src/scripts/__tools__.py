@@ -1,20 +1,28 @@
 import os
+from typing import Iterator
 
 
-def find_files(root_dir: str, extension: str) -> list:
+def find_files(root_dir: str, extension: str) -> Iterator[str]:
     """
-    Returns a list of files with given extension in the root directory.
+    Yields the files with given extension in the root directory and its subdirectories.
+    Uses os.scandir, which reads the entry type from the directory listing instead of an extra stat per file.
+    Unreadable or missing directories are skipped, as os.walk does.
     :param root_dir: Root directory to search
     :param extension: File extension to search for
-    :return: List of files with given extension
+    :return: Generator of files with given extension, use list() if a list is needed
     """
-    target_files = []
-    for root, dirs, files in os.walk(root_dir):
-        for file in files:
-            _extension = os.path.splitext(file)[1]
-            if _extension in (extension, "." + extension):
-                path = os.path.join(root, file)
-                target_files.append(path)
-                # print(f"Found file: {path}")
-
-    return target_files
+    try:
+        entries = os.scandir(root_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_files(entry.path, extension)
+            elif entry.is_dir():
+                # symlink to a directory, os.walk lists it as a directory and does not follow it
+                continue
+            else:
+                _extension = os.path.splitext(entry.name)[1]
+                if _extension in (extension, "." + extension):
+                    yield entry.path
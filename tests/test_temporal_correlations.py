@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from nanopyx.core.transform.sr_temporal_correlations import *
 
 
@@ -79,3 +80,89 @@ def test_acrf():
     img = np.random.random((20, 100, 100))
     calculate_acrf_(img, 2, 1)
     calculate_acrf_(img, 4, 1)
+
+
+def test_srrf_tcorr_numba_engine():
+    pytest.importorskip("numba")
+    img = np.random.random((20, 100, 100)).astype(np.float32)
+    for order in (-1, 2, 3, 4):
+        for do_integrate_lag_times in (0, 1):
+            numpy_out = calculate_SRRF_temporal_correlations(img, order, do_integrate_lag_times)
+            numba_out = calculate_SRRF_temporal_correlations(img, order, do_integrate_lag_times, engine="numba")
+            assert np.allclose(numpy_out, numba_out, rtol=1e-4, atol=1e-6)
+
+
+def test_srrf_tcorr_invalid_engine():
+    img = np.random.random((10, 20, 20)).astype(np.float32)
+    for order in (0, 1, -1, 2):
+        with pytest.raises(ValueError):
+            calculate_SRRF_temporal_correlations(img, order, engine="cuda")
+
+
+def test_pairwise_product_sum_with_empty_frames():
+    img = np.random.random((10, 20, 20)).astype(np.float32) - 0.2
+    img[3] = -1  # frame that is all zeros after clipping
+
+    expected = np.zeros((20, 20), dtype=np.float32)
+    for t0 in range(img.shape[0]):
+        for t1 in range(t0, img.shape[0]):
+            expected += np.maximum(img[t0], 0) * np.maximum(img[t1], 0)
+    expected /= img.shape[0] * (img.shape[0] + 1) // 2
+
+    assert np.allclose(calculate_pairwise_product_sum(img), expected, rtol=1e-4)
+
+
+def _acrf_cumulant_reference(im, mean, order):
+    c = im - mean
+    abcd = abc = ab = cd = ac = bd = ad = bc = 0
+    for t in range(im.shape[0] - order):
+        a, b = c[t], c[t + 1]
+        ab = ab + a * b
+        if order == 3:
+            abc = abc + a * b * c[t + 2]
+        if order == 4:
+            c_, d = c[t + 2], c[t + 3]
+            abcd = abcd + a * b * c_ * d
+            cd = cd + c_ * d
+            ac = ac + a * c_
+            bd = bd + b * d
+            ad = ad + a * d
+            bc = bc + b * c_
+    if order == 3:
+        return np.absolute(abc)
+    elif order == 4:
+        return np.absolute(abcd - ab * cd - ac * bd - ad * bc)
+    return np.absolute(ab)
+
+
+def test_acrf_values():
+    img = np.random.random((20, 30, 30))
+    mean = np.mean(img, axis=0)
+    for order in (2, 3, 4):
+        expected = _acrf_cumulant_reference(img, mean, order) / img.shape[0]
+        assert np.allclose(calculate_acrf_(img, order, 0), expected, rtol=1e-4, atol=1e-7)
+
+
+def test_acrf_integrated_lag_times_values():
+    img = np.random.random((20, 30, 30))
+    mean = np.mean(img, axis=0)
+    order = 2
+
+    im = img
+    n_binned_time_points = img.shape[0]
+    while n_binned_time_points > order:
+        expected = _acrf_cumulant_reference(im, mean, order) / n_binned_time_points
+        n_binned_time_points = n_binned_time_points // order
+        im = im[: n_binned_time_points * order].reshape(n_binned_time_points, order, 30, 30).mean(axis=1)
+
+    assert np.allclose(calculate_acrf_(img, order, 1), expected, rtol=1e-4, atol=1e-7)
+
+
+def test_acrf_row_strips(monkeypatch):
+    img = np.random.random((20, 37, 30)).astype(np.float32)
+    single_strip = [calculate_acrf_(img, order, 0) for order in (2, 3, 4)]
+
+    # 3 rows per strip, 37 rows leave a partial last strip
+    monkeypatch.setattr("nanopyx.core.transform.sr_temporal_correlations.ACRF_TILE_BYTES", 4 * 20 * 30 * 3)
+    for order, expected in zip((2, 3, 4), single_strip):
+        assert np.array_equal(calculate_acrf_(img, order, 0), expected)